@@ -12,57 +12,268 @@ Sub-commands:
 """
 
 import os
+import glob
+import json
+import math
+import time
+import random
+import asyncio
 import argparse
+import functools
+import itertools
+import aiohttp
 import pandas as pd
-from datetime import datetime
+import pyarrow as pa
+import pyarrow.parquet as pq
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
 from github import Github
 
-def load_env_file(env_path='.env'):
-    """Load environment variables from .env file"""
-    if os.path.exists(env_path):
-        with open(env_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    os.environ[key.strip()] = value.strip()
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+GITHUB_API_URL = "https://api.github.com"
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+PER_PAGE = 100
+MAX_CONCURRENCY = 64
+RATE_LIMIT_LOW_WATER = 10
+MAX_RETRIES = 5
+# A row cap is only an upper bound; never preallocate more slots than this up front
+MAX_PREALLOCATE = 10_000
+
+# Fixed Parquet schemas, so every streamed batch lands in the same file layout
+# whatever dtypes pandas inferred for it (e.g. a page without closed issues)
+COMMITS_SCHEMA = pa.schema([
+    ('sha', pa.string()),
+    ('author', pa.string()),
+    ('email', pa.string()),
+    ('date', pa.string()),
+    ('message', pa.string()),
+])
+ISSUES_SCHEMA = pa.schema([
+    ('id', pa.int64()),
+    ('number', pa.int64()),
+    ('title', pa.string()),
+    ('user', pa.string()),
+    ('state', pa.string()),
+    ('created_at', pa.string()),
+    ('closed_at', pa.string()),
+    ('comments', pa.int64()),
+    ('open_duration_days', pa.float64()),
+])
+
+# Only the fields fetch_commits needs, 100 commits of the default branch per query
+COMMIT_HISTORY_QUERY = """
+query($owner: String!, $name: String!, $first: Int!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    defaultBranchRef {
+      target {
+        ... on Commit {
+          history(first: $first, after: $cursor) {
+            pageInfo { endCursor hasNextPage }
+            nodes { oid message author { name email date } }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+try:
+    from dotenv import load_dotenv
+except ImportError:
+    def load_dotenv(dotenv_path='.env'):
+        """Fallback for python-dotenv: load KEY=VALUE lines without overriding existing variables."""
+        if os.path.exists(dotenv_path):
+            with open(dotenv_path) as f:
+                pairs = (line.split('=', 1) for line in f.read().splitlines()
+                         if '=' in line and not line.lstrip().startswith('#'))
+                for key, value in pairs:
+                    os.environ.setdefault(key.strip(), value.strip())
 
 # Load environment variables from .env file
-load_env_file()
+load_dotenv('.env')
 
-def fetch_commits(repo_full_name: str, max_commits: int = None) -> pd.DataFrame:
-    """
-    Fetch up to `max_commits` from the specified GitHub repository.
-    Returns a DataFrame with columns: sha, author, email, date, message.
-    """
-    # 1) Read GitHub token from environment
+def _get_token() -> str:
+    """Read the GitHub token from the environment, which every backend requires."""
     token = os.getenv('GITHUB_TOKEN')
     if not token:
         raise ValueError("GITHUB_TOKEN environment variable is required")
-    
-    # 2) Initialize GitHub client and get the repo
-    g = Github(token)
-    repo = g.get_repo(repo_full_name)
-    
-    # 3) Fetch commit objects (paginated by PyGitHub)
-    commits = []
+    return token
+
+@functools.lru_cache(maxsize=8)
+def _get_repo(token: str, full_name: str):
+    """
+    Return the PyGitHub repo handle for `full_name`, cached per token so repeated
+    fetches skip the GET /repos/{owner}/{name} round trip.
+    """
+    return Github(token, per_page=PER_PAGE).get_repo(full_name)
+
+def _open_duration_days(created, closed) -> pd.Series:
+    """
+    Whole days between each created/closed timestamp pair, computed as one
+    vectorized datetime64 subtraction. Issues that are still open get NaN.
+    Always float64, so every streamed batch formats the column the same way.
+    """
+    created_s = pd.to_datetime(pd.Series(created, dtype=object), utc=True)
+    closed_s = pd.to_datetime(pd.Series(closed, dtype=object), utc=True)
+    return (closed_s - created_s).dt.days.astype('float64')
+
+def _take_columns(rows, ncols: int, size: int = None):
+    """
+    Read up to `size` row tuples (all remaining rows when None) from the `rows`
+    iterator into `ncols` column lists. With a known size the lists are
+    preallocated (up to MAX_PREALLOCATE slots, growing past that) and trimmed
+    to the number of rows actually read.
+    """
+    if not size:
+        columns = tuple([] for _ in range(ncols))
+        for row in rows:
+            for column, value in zip(columns, row):
+                column.append(value)
+        return columns
+
+    prealloc = min(size, MAX_PREALLOCATE)
+    columns = tuple([None] * prealloc for _ in range(ncols))
+    i = 0
+    for row in itertools.islice(rows, size):
+        if i < prealloc:
+            for column, value in zip(columns, row):
+                column[i] = value
+        else:
+            for column, value in zip(columns, row):
+                column.append(value)
+        i += 1
+    if i < prealloc:
+        columns = tuple(column[:i] for column in columns)
+    return columns
+
+def _no_rows(max_items) -> bool:
+    """
+    True when a row cap asks for nothing at all. As before the backends were
+    added, a negative cap means "no rows" (and sends no requests), while None
+    and 0 mean unlimited.
+    """
+    return max_items is not None and max_items < 0
+
+def _iter_column_batches(rows, ncols: int, max_rows: int = None, batch_size: int = None):
+    """
+    Split the `rows` iterator into column batches of up to `batch_size` rows
+    (a single batch when None), stopping after `max_rows` rows.
+    Always yields at least one, possibly empty, batch.
+    """
+    if _no_rows(max_rows):
+        yield tuple([] for _ in range(ncols))
+        return
+    remaining = max_rows or None
+    first = True
+    while remaining is None or remaining > 0:
+        size = batch_size if remaining is None else min(batch_size or remaining, remaining)
+        columns = _take_columns(rows, ncols, size)
+        count = len(columns[0])
+        if count or first:
+            yield columns
+        if size is None or count < size:
+            return
+        first = False
+        if remaining is not None:
+            remaining -= count
+
+def _commit_rows(repo):
+    """Normalize PyGitHub commit objects into (sha, author, email, date, message) rows."""
     for commit in repo.get_commits():
-        if max_commits and len(commits) >= max_commits:
-            break
-            
-        # 4) Normalize each commit into a record dict
-        commit_data = {
-            'sha': commit.sha,
-            'author': commit.commit.author.name if commit.commit.author else 'Unknown',
-            'email': commit.commit.author.email if commit.commit.author else 'Unknown',
-            'date': commit.commit.author.date.isoformat() if commit.commit.author else 'Unknown',
-            'message': commit.commit.message.split('\n')[0] if commit.commit.message else 'No message'
-        }
-        commits.append(commit_data)
-    
-    # 5) Build DataFrame from records
-    return pd.DataFrame(commits)
+        author = commit.commit.author
+        message = commit.commit.message
+        yield (
+            commit.sha,
+            author.name if author else 'Unknown',
+            author.email if author else 'Unknown',
+            author.date.isoformat() if author else 'Unknown',
+            # partition stops at the first newline instead of splitting the whole body
+            message.partition('\n')[0] if message else 'No message',
+        )
 
+def _issue_rows(repo, state: str):
+    """
+    Normalize PyGitHub issue objects into rows, skipping pull requests.
+    created_at/closed_at stay datetimes so open_duration_days can be computed per column.
+    """
+    for issue in repo.get_issues(state=state):
+        # Skip pull requests. Their html_url points at /pull/ instead of /issues/.
+        # html_url is in the list payload, while reading issue.pull_request on a
+        # plain issue makes PyGitHub lazily GET the full issue.
+        if '/pull/' in issue.html_url:
+            continue
+        yield (
+            issue.id,
+            issue.number,
+            issue.title,
+            issue.user.login if issue.user else 'Unknown',
+            issue.state,
+            issue.created_at,
+            issue.closed_at,
+            issue.comments,
+        )
+
+def iter_commits(repo_full_name: str, max_commits: int = None, batch_size: int = PER_PAGE):
+    """
+    Fetch up to `max_commits` from the specified GitHub repository, yielding
+    DataFrames of at most `batch_size` commits as pages arrive (a single
+    DataFrame when batch_size is None). Columns match `fetch_commits`.
+    """
+    # 1) Read GitHub token from environment
+    token = _get_token()
+
+    # 2) Get the (cached) repo handle
+    repo = _get_repo(token, repo_full_name)
+
+    # 3) Fetch commit objects (paginated by PyGitHub) into one list per column
+    for shas, authors, emails, dates, messages in _iter_column_batches(
+            _commit_rows(repo), 5, max_commits, batch_size):
+        yield pd.DataFrame({
+            'sha': shas,
+            'author': authors,
+            'email': emails,
+            'date': dates,
+            'message': messages,
+        }, copy=False)
+
+def iter_issues(repo_full_name: str, state: str = "all", max_issues: int = None, batch_size: int = PER_PAGE):
+    """
+    Fetch up to `max_issues` from the specified GitHub repository, yielding
+    DataFrames of at most `batch_size` issues as pages arrive (a single
+    DataFrame when batch_size is None). Columns match `fetch_issues`.
+    """
+    # 1) Read GitHub token from environment
+    token = _get_token()
+
+    # 2) Get the (cached) repo handle
+    repo = _get_repo(token, repo_full_name)
+
+    # 3) Fetch issue objects (paginated by PyGitHub) into one list per column
+    for ids, numbers, titles, users, states, created, closed, comments in _iter_column_batches(
+            _issue_rows(repo, state), 8, max_issues, batch_size):
+        yield pd.DataFrame({
+            'id': ids,
+            'number': numbers,
+            'title': titles,
+            'user': users,
+            'state': states,
+            'created_at': [d.isoformat() if d else None for d in created],
+            'closed_at': [d.isoformat() if d else None for d in closed],
+            'comments': comments,
+            'open_duration_days': _open_duration_days(created, closed),
+        }, copy=False)
+
+def fetch_commits(repo_full_name: str, max_commits: int = None) -> pd.DataFrame:
+    """
+    Fetch up to `max_commits` from the specified GitHub repository.
+    Returns a DataFrame with columns: sha, author, email, date, message.
+    """
+    return next(iter_commits(repo_full_name, max_commits, batch_size=None))
 
 def fetch_issues(repo_full_name: str, state: str = "all", max_issues: int = None) -> pd.DataFrame:
     """
@@ -70,101 +281,474 @@ def fetch_issues(repo_full_name: str, state: str = "all", max_issues: int = None
     Skips pull requests and returns only issues.
     Returns a DataFrame with columns: id, number, title, user, state, created_at, closed_at, comments, open_duration_days.
     """
-    # 1) Read GitHub token from environment
-    token = os.getenv('GITHUB_TOKEN')
-    if not token:
-        raise ValueError("GITHUB_TOKEN environment variable is required")
-    
-    # 2) Initialize GitHub client and get the repo
-    g = Github(token)
-    repo = g.get_repo(repo_full_name)
-    
-    # 3) Fetch issue objects (paginated by PyGitHub)
-    issues = []
-    for issue in repo.get_issues(state=state):
-        if max_issues and len(issues) >= max_issues:
+    return next(iter_issues(repo_full_name, state, max_issues, batch_size=None))
+
+def _write_frames(path: str, frames, schema: pa.Schema) -> int:
+    """
+    Write an iterable of DataFrames to `path` as they arrive and return the number
+    of rows written. CSV output is appended batch by batch, taking the header from
+    the first one; a `.parquet` path gets one zstd-compressed row group per batch,
+    cast to `schema`. Batches go to `path + '.tmp'`, which only replaces `path`
+    once every batch is written, so a failed fetch leaves an existing file intact.
+    """
+    tmp_path = path + '.tmp'
+    total = 0
+    try:
+        if path.endswith('.parquet'):
+            with pq.ParquetWriter(tmp_path, schema, compression='zstd') as writer:
+                for df in frames:
+                    writer.write_table(pa.Table.from_pandas(df, schema=schema, preserve_index=False))
+                    total += len(df)
+        else:
+            with open(tmp_path, 'w', newline='') as f:
+                for i, df in enumerate(frames):
+                    df.to_csv(f, index=False, header=(i == 0))
+                    total += len(df)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    os.replace(tmp_path, path)
+    return total
+
+def _read_frame(path: str, columns) -> pd.DataFrame:
+    """Read only `columns` from a CSV or `.parquet` file into pyarrow-backed columns."""
+    if path.endswith('.parquet'):
+        return pd.read_parquet(path, engine='pyarrow', columns=columns, dtype_backend='pyarrow')
+    return pd.read_csv(path, engine='pyarrow', usecols=columns, dtype_backend='pyarrow')
+
+class RateLimiter:
+    """
+    Token bucket fed by GitHub's rate-limit headers.
+    Each request takes one token from the last reported `X-RateLimit-Remaining`;
+    once that drops to the low-water mark, callers wait until `X-RateLimit-Reset`.
+    """
+
+    def __init__(self, low_water: int = RATE_LIMIT_LOW_WATER):
+        self.low_water = low_water
+        self.remaining = None
+        self.reset_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            if self.remaining is not None and self.remaining <= self.low_water:
+                delay = self.reset_at - time.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                # Unknown again until the next response reports the new window
+                self.remaining = None
+            if self.remaining is not None:
+                self.remaining -= 1
+
+    def update(self, headers):
+        remaining = headers.get('X-RateLimit-Remaining')
+        reset = headers.get('X-RateLimit-Reset')
+        if remaining is None or reset is None:
+            return
+        remaining, reset = int(remaining), float(reset)
+        # Concurrent responses arrive out of order; within one window trust the lowest count
+        if self.remaining is None or reset != self.reset_at:
+            self.remaining = remaining
+        else:
+            self.remaining = min(self.remaining, remaining)
+        self.reset_at = reset
+
+def _retry_delay(resp, attempt: int):
+    """
+    Seconds to wait before retrying `resp`, or None if it should not be retried.
+    Secondary rate limits send Retry-After; an exhausted quota is waited out until
+    X-RateLimit-Reset; 429 and 5xx responses back off exponentially with jitter.
+    """
+    retry_after = resp.headers.get('Retry-After')
+    if resp.status in (403, 429) and retry_after is not None:
+        return float(retry_after)
+    if resp.status in (403, 429) and resp.headers.get('X-RateLimit-Remaining') == '0':
+        return max(float(resp.headers.get('X-RateLimit-Reset', 0)) - time.time(), 0)
+    if resp.status == 429 or resp.status >= 500:
+        return min(2 ** attempt, 60) + random.random()
+    return None
+
+async def gh_request(session, method, url, limiter=None, **kwargs):
+    """
+    Send a GitHub API request and return its decoded JSON body along with the response links.
+    Waits on `limiter` before each attempt, and retries rate-limited and server
+    error responses up to MAX_RETRIES times. `kwargs` go to `session.request`.
+    """
+    for attempt in range(MAX_RETRIES + 1):
+        if limiter is not None:
+            await limiter.acquire()
+        async with session.request(method, url, **kwargs) as resp:
+            if limiter is not None:
+                limiter.update(resp.headers)
+            delay = _retry_delay(resp, attempt) if attempt < MAX_RETRIES else None
+            if delay is None:
+                resp.raise_for_status()
+                # Decode the raw body ourselves so orjson can parse the bytes directly
+                return json_loads(await resp.read()), resp.links
+        await asyncio.sleep(delay)
+
+async def gh_get(session, url, params=None, headers=None, limiter=None):
+    """GET a GitHub REST URL through `gh_request`."""
+    return await gh_request(session, 'GET', url, limiter, params=params, headers=headers)
+
+async def _gql(session, query, variables, headers, limiter=None):
+    """POST a GraphQL query through `gh_request` and return its `data`, raising on GraphQL errors."""
+    body, _ = await gh_request(session, 'POST', GITHUB_GRAPHQL_URL, limiter,
+                               json={'query': query, 'variables': variables}, headers=headers)
+    if body.get('errors'):
+        messages = '; '.join(error.get('message', str(error)) for error in body['errors'])
+        raise RuntimeError(f"GitHub GraphQL error: {messages}")
+    return body['data']
+
+async def _iter_item_pages(session, url, params, token, max_items=None, include=None):
+    """
+    Yield the items of a paginated GitHub REST list endpoint one page at a time.
+    The first page tells us the last page number (Link: rel="last"); the
+    remaining pages are then requested concurrently through a sliding window of
+    at most MAX_CONCURRENCY pages ahead of the consumer, and handed back in page
+    order. Page p + MAX_CONCURRENCY is only requested once page p has been
+    yielded, so a slow page never lets finished pages pile up in memory.
+    `include` optionally filters raw items. The first page is always yielded,
+    even when empty.
+    """
+    headers = {
+        'Authorization': f'token {token}',
+        'Accept': 'application/vnd.github+json',
+    }
+    limiter = RateLimiter()
+    count = 0
+    if _no_rows(max_items):
+        yield []
+        return
+
+    async def fetch_page(page):
+        page_params = {**params, 'per_page': PER_PAGE, 'page': page}
+        return await gh_get(session, url, page_params, headers, limiter)
+
+    def keep(data):
+        nonlocal count
+        items = [item for item in data if include is None or include(item)]
+        if max_items:
+            items = items[:max_items - count]
+        count += len(items)
+        return items
+
+    first, links = await fetch_page(1)
+    last = links.get('last')
+    last_page = int(last['url'].query['page']) if last else 1
+    yield keep(first)
+
+    pending = deque()
+    next_page = 2
+    try:
+        while not (max_items and count >= max_items):
+            # Top up the window, requesting no more pages than max_items still needs
+            while (next_page <= last_page and len(pending) < MAX_CONCURRENCY
+                   and not (max_items and len(pending) >= math.ceil((max_items - count) / PER_PAGE))):
+                pending.append(asyncio.ensure_future(fetch_page(next_page)))
+                next_page += 1
+            if not pending:
+                return
+            data, _ = await pending.popleft()
+            items = keep(data)
+            if items:
+                yield items
+    finally:
+        # Don't leave requests running if the consumer stops early
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+async def _collect_items(pages, max_items=None):
+    """
+    Flatten async item pages into one list. With `max_items` the list is
+    preallocated (up to MAX_PREALLOCATE slots) and filled by slice, then
+    trimmed to the items received.
+    """
+    if not max_items or _no_rows(max_items):
+        return [item async for items in pages for item in items]
+    collected = [None] * min(max_items, MAX_PREALLOCATE)
+    i = 0
+    async for items in pages:
+        # Slice assignment past the preallocated slots grows the list as needed
+        collected[i:i + len(items)] = items
+        i += len(items)
+    return collected[:i] if i < len(collected) else collected
+
+def _rest_commits_frame(items) -> pd.DataFrame:
+    """Normalize REST commit JSON items into the `fetch_commits` columns."""
+    # Commit authors can be missing, keep the same fallbacks as fetch_commits
+    authors = [item['commit'].get('author') for item in items]
+    messages = [item['commit'].get('message') for item in items]
+    return pd.DataFrame({
+        'sha': [item['sha'] for item in items],
+        'author': [a['name'] if a else 'Unknown' for a in authors],
+        'email': [a['email'] if a else 'Unknown' for a in authors],
+        'date': [a['date'].replace('Z', '+00:00') if a else 'Unknown' for a in authors],
+        'message': [m.partition('\n')[0] if m else 'No message' for m in messages],
+    }, copy=False)
+
+def _rest_issues_frame(items) -> pd.DataFrame:
+    """Normalize REST issue JSON items into the `fetch_issues` columns."""
+    created = [item['created_at'].replace('Z', '+00:00') if item['created_at'] else None for item in items]
+    closed = [item['closed_at'].replace('Z', '+00:00') if item['closed_at'] else None for item in items]
+    return pd.DataFrame({
+        'id': [item['id'] for item in items],
+        'number': [item['number'] for item in items],
+        'title': [item['title'] for item in items],
+        'user': [item['user']['login'] if item['user'] else 'Unknown' for item in items],
+        'state': [item['state'] for item in items],
+        'created_at': created,
+        'closed_at': closed,
+        'comments': [item['comments'] for item in items],
+        'open_duration_days': _open_duration_days(created, closed),
+    }, copy=False)
+
+def _commit_pages(session, repo_full_name: str, max_commits: int = None):
+    """REST commit pages for `repo_full_name`."""
+    token = _get_token()
+
+    url = f"{GITHUB_API_URL}/repos/{repo_full_name}/commits"
+    return _iter_item_pages(session, url, {}, token, max_commits)
+
+def _issue_pages(session, repo_full_name: str, state: str = "all", max_issues: int = None):
+    """REST issue pages for `repo_full_name`, without pull requests."""
+    token = _get_token()
+
+    url = f"{GITHUB_API_URL}/repos/{repo_full_name}/issues"
+    # The issues endpoint also lists pull requests; they are the items carrying a
+    # pull_request key, so a dict membership test filters them before normalizing
+    return _iter_item_pages(session, url, {'state': state}, token, max_issues,
+                            include=lambda item: 'pull_request' not in item)
+
+async def iter_commits_async(repo_full_name: str, max_commits: int = None, session=None):
+    """
+    Async REST counterpart of `iter_commits`.
+    Yields one DataFrame per fetched page of commits, in order.
+    """
+    if session is None:
+        async with aiohttp.ClientSession() as session:
+            async for df in iter_commits_async(repo_full_name, max_commits, session):
+                yield df
+        return
+
+    async for items in _commit_pages(session, repo_full_name, max_commits):
+        yield _rest_commits_frame(items)
+
+async def iter_issues_async(repo_full_name: str, state: str = "all", max_issues: int = None, session=None):
+    """
+    Async REST counterpart of `iter_issues`.
+    Yields one DataFrame per fetched page of issues, in order, skipping pull requests.
+    """
+    if session is None:
+        async with aiohttp.ClientSession() as session:
+            async for df in iter_issues_async(repo_full_name, state, max_issues, session):
+                yield df
+        return
+
+    async for items in _issue_pages(session, repo_full_name, state, max_issues):
+        yield _rest_issues_frame(items)
+
+async def fetch_commits_async(repo_full_name: str, max_commits: int = None, session=None) -> pd.DataFrame:
+    """
+    Async REST counterpart of `fetch_commits`.
+    Fetches commit pages concurrently with aiohttp and returns the same columns.
+    """
+    if session is None:
+        async with aiohttp.ClientSession() as session:
+            return await fetch_commits_async(repo_full_name, max_commits, session)
+
+    items = await _collect_items(_commit_pages(session, repo_full_name, max_commits), max_commits)
+    return _rest_commits_frame(items)
+
+async def fetch_issues_async(repo_full_name: str, state: str = "all", max_issues: int = None, session=None) -> pd.DataFrame:
+    """
+    Async REST counterpart of `fetch_issues`.
+    Fetches issue pages concurrently with aiohttp, skips pull requests and returns the same columns.
+    """
+    if session is None:
+        async with aiohttp.ClientSession() as session:
+            return await fetch_issues_async(repo_full_name, state, max_issues, session)
+
+    items = await _collect_items(_issue_pages(session, repo_full_name, state, max_issues), max_issues)
+    return _rest_issues_frame(items)
+
+async def fetch_commits_graphql_async(repo_full_name: str, max_commits: int = None, session=None) -> pd.DataFrame:
+    """
+    GraphQL counterpart of `fetch_commits`.
+    Walks the default branch history 100 commits per query, requesting only the
+    fields we keep, and returns the same columns.
+    """
+    if session is None:
+        async with aiohttp.ClientSession() as session:
+            return await fetch_commits_graphql_async(repo_full_name, max_commits, session)
+
+    token = _get_token()
+
+    owner, name = repo_full_name.split('/', 1)
+    headers = {'Authorization': f'token {token}'}
+    limiter = RateLimiter()
+    # Preallocate when capped (bounded by MAX_PREALLOCATE, slice assignment grows
+    # past it); `count` tracks how many slots are filled
+    nodes = [None] * min(max_commits, MAX_PREALLOCATE) if max_commits else []
+    count = 0
+    cursor = None
+    while not _no_rows(max_commits) and not (max_commits and count >= max_commits):
+        first = min(PER_PAGE, max_commits - count) if max_commits else PER_PAGE
+        data = await _gql(session, COMMIT_HISTORY_QUERY,
+                          {'owner': owner, 'name': name, 'first': first, 'cursor': cursor},
+                          headers, limiter)
+        branch = data['repository']['defaultBranchRef']
+        if branch is None:
+            # Empty repository, nothing to walk
             break
-            
-        # 4) Skip pull requests (they have pull_request attribute)
-        if hasattr(issue, 'pull_request') and issue.pull_request is not None:
-            continue
-            
-        # 5) Normalize each issue into a record dict
-        created_at = issue.created_at.isoformat() if issue.created_at else None
-        closed_at = issue.closed_at.isoformat() if issue.closed_at else None
-        
-        # Calculate open_duration_days
-        open_duration_days = None
-        if created_at and closed_at:
-            created_dt = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-            closed_dt = datetime.fromisoformat(closed_at.replace('Z', '+00:00'))
-            open_duration_days = (closed_dt - created_dt).days
-        
-        issue_data = {
-            'id': issue.id,
-            'number': issue.number,
-            'title': issue.title,
-            'user': issue.user.login if issue.user else 'Unknown',
-            'state': issue.state,
-            'created_at': created_at,
-            'closed_at': closed_at,
-            'comments': issue.comments,
-            'open_duration_days': open_duration_days
-        }
-        issues.append(issue_data)
-    
-    # 6) Build DataFrame from records
-    return pd.DataFrame(issues)
-    
-def merge_and_summarize(commits_df, issues_df) -> None:
+        history = branch['target']['history']
+        page = history['nodes']
+        if max_commits:
+            page = page[:max_commits - count]
+            nodes[count:count + len(page)] = page
+        else:
+            nodes.extend(page)
+        count += len(page)
+        if not history['pageInfo']['hasNextPage']:
+            break
+        cursor = history['pageInfo']['endCursor']
+
+    if count < len(nodes):
+        nodes = nodes[:count]
+
+    # GraphQL reports author dates in the author's own offset; normalize to UTC like REST
+    authors = [node.get('author') for node in nodes]
+    dates = pd.to_datetime(pd.Series([a['date'] if a else None for a in authors], dtype=object), utc=True)
+    return pd.DataFrame({
+        'sha': [node['oid'] for node in nodes],
+        'author': [a['name'] if a else 'Unknown' for a in authors],
+        'email': [a['email'] if a else 'Unknown' for a in authors],
+        'date': dates.dt.strftime('%Y-%m-%dT%H:%M:%S+00:00').fillna('Unknown'),
+        'message': [m.partition('\n')[0] if (m := node['message']) else 'No message' for node in nodes],
+    }, copy=False)
+
+async def _anext(agen):
+    return await agen.__anext__()
+
+def _iter_sync(agen):
+    """Drive an async generator from synchronous code on one private event loop."""
+    with asyncio.Runner() as runner:
+        try:
+            while True:
+                try:
+                    yield runner.run(_anext(agen))
+                except StopAsyncIteration:
+                    return
+        finally:
+            runner.run(agen.aclose())
+
+def iter_commits_rest(repo_full_name: str, max_commits: int = None):
+    """Synchronous wrapper around `iter_commits_async`."""
+    return _iter_sync(iter_commits_async(repo_full_name, max_commits))
+
+def iter_issues_rest(repo_full_name: str, state: str = "all", max_issues: int = None):
+    """Synchronous wrapper around `iter_issues_async`."""
+    return _iter_sync(iter_issues_async(repo_full_name, state, max_issues))
+
+def fetch_commits_rest(repo_full_name: str, max_commits: int = None) -> pd.DataFrame:
+    """Synchronous wrapper around `fetch_commits_async`."""
+    return asyncio.run(fetch_commits_async(repo_full_name, max_commits))
+
+def fetch_commits_graphql(repo_full_name: str, max_commits: int = None) -> pd.DataFrame:
+    """Synchronous wrapper around `fetch_commits_graphql_async`."""
+    return asyncio.run(fetch_commits_graphql_async(repo_full_name, max_commits))
+
+def fetch_issues_rest(repo_full_name: str, state: str = "all", max_issues: int = None) -> pd.DataFrame:
+    """Synchronous wrapper around `fetch_issues_async`."""
+    return asyncio.run(fetch_issues_async(repo_full_name, state, max_issues))
+
+def _commit_counts(commits_df) -> Counter:
+    """Commit count per author, in order of first appearance."""
+    return Counter(commits_df.groupby('author', sort=False).size().to_dict())
+
+def _issue_stats(issues_df):
     """
-    Merge commits and issues on date and summarize the data.
-    Computes and prints:
-    - Top 5 committers by count
-    - Issue close rate (closed / total)
-    - Average issue open duration
+    Return (closed, total, duration_sum, duration_count) for the issues, where the
+    duration figures cover closed issues that have an open_duration_days value.
     """
-    # Convert date columns to datetime for proper joining
-    commits_df['date'] = pd.to_datetime(commits_df['date'])
-    issues_df['created_at'] = pd.to_datetime(issues_df['created_at'])
-    
-    # Create date columns for joining (by day)
-    commits_df['date_day'] = commits_df['date'].dt.date
-    issues_df['created_date'] = issues_df['created_at'].dt.date
-    
-    # Join commits and issues on date
-    merged_df = pd.merge(commits_df, issues_df, left_on='date_day', right_on='created_date', how='outer')
-    
+    is_closed = issues_df['state'].eq('closed')
+    durations = issues_df.loc[is_closed, 'open_duration_days']
+    return int(is_closed.sum()), len(issues_df), float(durations.sum()), int(durations.count())
+
+def _print_summary(author_counts: Counter, closed_issues: int, total_issues: int,
+                   duration_sum: float, duration_count: int) -> None:
+    """Print the summary from commit counts per author and the `_issue_stats` figures."""
     print("SUMMARY STATISTICS")
     print()
     
     # Top 5 committers by count
     print("Top 5 committers by commit count:")
-    top_committers = commits_df['author'].value_counts().head(5)
-    for author, count in top_committers.items():
+    for author, count in author_counts.most_common(5):
         print(f"  {author}: {count} commits")
     print()
     
     # Issue close rate
-    total_issues = len(issues_df)
-    closed_issues = len(issues_df[issues_df['state'] == 'closed'])
     close_rate = (closed_issues / total_issues * 100) if total_issues > 0 else 0
     print(f"Issue close rate: {close_rate:.1f}% ({closed_issues}/{total_issues})")
     print()
     
-    # Average issue open duration (only for closed issues)
-    closed_issues_with_duration = issues_df[
-        (issues_df['state'] == 'closed') & 
-        (issues_df['open_duration_days'].notna())
-    ]
-    if len(closed_issues_with_duration) > 0:
-        avg_duration = closed_issues_with_duration['open_duration_days'].mean()
+    # Average issue open duration (only for closed issues with duration data)
+    if duration_count > 0:
+        avg_duration = duration_sum / duration_count
         print(f"Average issue open duration: {avg_duration:.1f} days")
     else:
         print("Average issue open duration: N/A (no closed issues with duration data)")
     print()
-    
-    return merged_df
+
+def merge_and_summarize(commits_df, issues_df) -> None:
+    """
+    Summarize the commits and issues data.
+    Computes and prints:
+    - Top 5 committers by count
+    - Issue close rate (closed / total)
+    - Average issue open duration
+    """
+    _print_summary(_commit_counts(commits_df), *_issue_stats(issues_df))
+
+def _partial_commit_summary(path: str) -> Counter:
+    """Commit counts per author for one commits shard."""
+    return _commit_counts(_read_frame(path, ['author']))
+
+def _partial_issue_summary(path: str):
+    """`_issue_stats` figures for one issues shard."""
+    return _issue_stats(_read_frame(path, ['state', 'open_duration_days']))
+
+def summarize_files(commit_paths, issue_paths) -> None:
+    """
+    Summarize commits and issues spread over several CSV/Parquet shards.
+    Each shard is reduced to counts in its own process and only those partial
+    results are merged, so no DataFrame crosses process boundaries.
+    """
+    # Spawning workers only pays off once there is more than one shard to read
+    if len(commit_paths) + len(issue_paths) > 2:
+        with ProcessPoolExecutor() as ex:
+            commit_partials = list(ex.map(_partial_commit_summary, commit_paths))
+            issue_partials = list(ex.map(_partial_issue_summary, issue_paths))
+    else:
+        commit_partials = [_partial_commit_summary(path) for path in commit_paths]
+        issue_partials = [_partial_issue_summary(path) for path in issue_paths]
+
+    author_counts = sum(commit_partials, Counter())
+    issue_totals = [sum(column) for column in zip(*issue_partials)]
+    _print_summary(author_counts, *issue_totals)
+
+def _expand_paths(pattern: str):
+    """Files matching a glob pattern, or the pattern itself when nothing matches."""
+    return sorted(glob.glob(pattern)) or [pattern]
+
+def _positive_int(value: str) -> int:
+    """argparse type for --max: an integer of at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
 
 def main():
     """
@@ -177,44 +761,58 @@ def main():
     subparsers = parser.add_subparsers(dest="command", required=True)
 
     # Sub-command: fetch-commits
-    c1 = subparsers.add_parser("fetch-commits", help="Fetch commits and save to CSV")
+    c1 = subparsers.add_parser("fetch-commits", help="Fetch commits and save to CSV or Parquet")
     c1.add_argument("--repo", required=True, help="Repository in owner/repo format")
-    c1.add_argument("--max",  type=int, dest="max_commits",
+    c1.add_argument("--max",  type=_positive_int, dest="max_commits",
                     help="Max number of commits to fetch")
-    c1.add_argument("--out",  required=True, help="Path to output commits CSV")
+    c1.add_argument("--out",  required=True, help="Path to output commits CSV (.parquet for Parquet)")
+    c1.add_argument("--backend", choices=["rest", "pygithub", "graphql"], default="rest",
+                    help="Fetch through the concurrent REST client, PyGitHub or GraphQL (default: rest)")
 
     # Sub-command: fetch-issues
-    c2 = subparsers.add_parser("fetch-issues", help="Fetch issues and save to CSV")
+    c2 = subparsers.add_parser("fetch-issues", help="Fetch issues and save to CSV or Parquet")
     c2.add_argument("--repo", required=True, help="Repository in owner/repo format")
     c2.add_argument("--state", choices=["all", "open", "closed"], default="all",
                     help="Issue state filter (default: all)")
-    c2.add_argument("--max", type=int, dest="max_issues",
+    c2.add_argument("--max", type=_positive_int, dest="max_issues",
                     help="Max number of issues to fetch")
-    c2.add_argument("--out", required=True, help="Path to output issues CSV")
+    c2.add_argument("--out", required=True, help="Path to output issues CSV (.parquet for Parquet)")
+    c2.add_argument("--backend", choices=["rest", "pygithub"], default="rest",
+                    help="Fetch through the concurrent REST client or PyGitHub (default: rest)")
 
     # Sub-command: summarize
-    c3 = subparsers.add_parser("summarize", help="Summarize commits and issues from CSV files")
-    c3.add_argument("--commits", required=True, help="Path to commits CSV file")
-    c3.add_argument("--issues", required=True, help="Path to issues CSV file")
+    c3 = subparsers.add_parser("summarize", help="Summarize commits and issues from CSV or Parquet files")
+    c3.add_argument("--commits", required=True,
+                    help="Path or glob (e.g. 'commits-*.csv') of commits CSV or Parquet files")
+    c3.add_argument("--issues", required=True,
+                    help="Path or glob (e.g. 'issues-*.csv') of issues CSV or Parquet files")
 
     args = parser.parse_args()
 
     # Dispatch based on selected command
     if args.command == "fetch-commits":
-        df = fetch_commits(args.repo, args.max_commits)
-        df.to_csv(args.out, index=False)
-        print(f"Saved {len(df)} commits to {args.out}")
+        if args.backend == "rest":
+            # Stream page-sized batches to disk instead of holding every commit in memory
+            frames = iter_commits_rest(args.repo, args.max_commits)
+        elif args.backend == "graphql":
+            # GraphQL history is collected into one DataFrame before it is written
+            frames = [fetch_commits_graphql(args.repo, args.max_commits)]
+        else:
+            # Stream page-sized batches, as for the REST backend
+            frames = iter_commits(args.repo, args.max_commits)
+        count = _write_frames(args.out, frames, COMMITS_SCHEMA)
+        print(f"Saved {count} commits to {args.out}")
     elif args.command == "fetch-issues":
-        df = fetch_issues(args.repo, args.state, args.max_issues)
-        df.to_csv(args.out, index=False)
-        print(f"Saved {len(df)} issues to {args.out}")
+        # Both issue backends stream page-sized batches to disk
+        if args.backend == "rest":
+            frames = iter_issues_rest(args.repo, args.state, args.max_issues)
+        else:
+            frames = iter_issues(args.repo, args.state, args.max_issues)
+        count = _write_frames(args.out, frames, ISSUES_SCHEMA)
+        print(f"Saved {count} issues to {args.out}")
     elif args.command == "summarize":
-        # Load CSV files
-        commits_df = pd.read_csv(args.commits)
-        issues_df = pd.read_csv(args.issues)
-        
-        # Run summary analysis
-        merge_and_summarize(commits_df, issues_df)
+        # Shards are read in parallel, each loading only the columns the summary uses
+        summarize_files(_expand_paths(args.commits), _expand_paths(args.issues))
 
 if __name__ == "__main__":
     main()
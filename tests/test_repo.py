@@ -1,10 +1,19 @@
 # tests/test_repo_miner.py
 
 import os
+import json
+import asyncio
+from pathlib import Path
 import pandas as pd
 import pytest
 from datetime import datetime, timedelta
-from src.repo_miner import fetch_commits, fetch_issues
+from yarl import URL
+import src.repo_miner as repo_miner
+from src.repo_miner import (
+    fetch_commits, fetch_issues, iter_commits, main, fetch_commits_async, fetch_issues_async, gh_get, RateLimiter,
+    fetch_commits_graphql_async, merge_and_summarize, iter_commits_async, summarize_files,
+    MAX_CONCURRENCY,
+)
 
 # --- Helpers for dummy GitHub API objects ---
 
@@ -38,8 +47,9 @@ class DummyIssue:
         self.created_at = created_at
         self.closed_at = closed_at
         self.comments = comments
-        # attribute only on pull requests
-        self.pull_request = DummyUser("pr") if is_pr else None
+        # pull requests listed by the issues endpoint link to /pull/ instead of /issues/
+        kind = "pull" if is_pr else "issues"
+        self.html_url = f"https://github.com/owner/repo/{kind}/{number}"
 
 class DummyRepo:
     def __init__(self, commits, issues):
@@ -67,14 +77,97 @@ class DummyGithub:
 # Global instance to be used by all tests
 gh_instance = DummyGithub("fake-token")
 
+# --- Helpers for dummy GitHub REST responses (aiohttp) ---
+
+class DummyResponse:
+    def __init__(self, data, last_page=None, status=200, headers=None, delay=0):
+        self._data = data
+        self._delay = delay
+        self.status = status
+        self.headers = headers or {}
+        self.links = {}
+        if last_page:
+            self.links = {"last": {"url": URL(f"https://api.github.com/x?page={last_page}")}}
+
+    async def __aenter__(self):
+        if self._delay:
+            await asyncio.sleep(self._delay)
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise RuntimeError(f"HTTP {self.status}")
+
+    async def read(self):
+        return json.dumps(self._data).encode()
+
+class DummySession:
+    """
+    Serves pre-built pages keyed by page number and records requested pages.
+    `failures` maps a page number to (status, headers) responses returned before the page itself.
+    """
+    def __init__(self, pages, failures=None):
+        self._pages = pages
+        self._failures = failures or {}
+        self.requested = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def request(self, method, url, params=None, headers=None):
+        assert method == "GET"
+        assert headers["Authorization"] == "token fake-token"
+        page = params["page"]
+        self.requested.append(page)
+        if self._failures.get(page):
+            status, failure_headers = self._failures[page].pop(0)
+            return DummyResponse(None, status=status, headers=failure_headers)
+        return DummyResponse(self._pages[page], last_page=len(self._pages))
+
+class DummyGraphQLSession:
+    """Serves commit history pages for successive GraphQL queries and records the variables sent."""
+    def __init__(self, pages):
+        self._pages = pages
+        self.variables = []
+
+    def request(self, method, url, json=None, headers=None):
+        assert method == "POST" and url.endswith("/graphql")
+        self.variables.append(json["variables"])
+        nodes = self._pages[len(self.variables) - 1][:json["variables"]["first"]]
+        has_next = len(self.variables) < len(self._pages)
+        history = {"pageInfo": {"endCursor": f"c{len(self.variables)}", "hasNextPage": has_next}, "nodes": nodes}
+        return DummyResponse({"data": {"repository": {"defaultBranchRef": {"target": {"history": history}}}}})
+
+def gql_commit(oid, author, message, date="2025-10-16T17:06:01-07:00"):
+    return {"oid": oid, "message": message, "author": {"name": author, "email": f"{author}@example.com", "date": date}}
+
+def rest_commit(sha, author, message, date="2025-10-17T00:06:01Z"):
+    return {"sha": sha, "commit": {"author": {"name": author, "email": f"{author}@example.com", "date": date},
+                                   "message": message}}
+
+def rest_issue(number, state, created_at, closed_at=None, is_pr=False):
+    item = {"id": number, "number": number, "title": f"Issue {number}", "user": {"login": "alice"},
+            "state": state, "created_at": created_at, "closed_at": closed_at, "comments": 0}
+    if is_pr:
+        item["pull_request"] = {"url": "https://api.github.com/pulls/1"}
+    return item
+
 @pytest.fixture(autouse=True)
 def patch_env_and_github(monkeypatch):
     # Set fake token
     monkeypatch.setenv("GITHUB_TOKEN", "fake-token")
     # Patch Github class to return our global instance
-    def mock_github(token):
+    def mock_github(token, **kwargs):
         return gh_instance
     monkeypatch.setattr("src.repo_miner.Github", mock_github)
+    # Repo handles are cached per token/repo; start every test from a clean cache
+    repo_miner._get_repo.cache_clear()
 
 # --- Tests for fetch_commits ---
 # An example test case
@@ -115,8 +208,184 @@ def test_fetch_commits_empty(monkeypatch):
     gh_instance._repo = DummyRepo([], [])
     df = fetch_commits("any/repo")
     assert len(df) == 0
-    # When empty, pandas DataFrame has no columns, which is expected behavior
-    assert len(df.columns) == 0
+    # Columns are built up front, so an empty result still carries the schema
+    assert list(df.columns) == ["sha", "author", "email", "date", "message"]
+
+def test_fetch_reuses_cached_repo(monkeypatch):
+    # Test that repeated fetches for the same repo build the client only once
+    calls = []
+    def counting_github(token, **kwargs):
+        calls.append(kwargs)
+        return gh_instance
+    monkeypatch.setattr("src.repo_miner.Github", counting_github)
+    gh_instance._repo = DummyRepo([], [])
+
+    fetch_commits("any/repo")
+    fetch_issues("any/repo")
+    assert calls == [{"per_page": 100}]
+
+def test_iter_commits_batches(monkeypatch):
+    # Test that iter_commits yields page-sized DataFrames and honors max_commits
+    now = datetime.now()
+    commits = [DummyCommit(f"sha{i}", "Alice", "a@example.com", now, f"Commit {i}") for i in range(5)]
+    gh_instance._repo = DummyRepo(commits, [])
+
+    assert [len(df) for df in iter_commits("any/repo", batch_size=2)] == [2, 2, 1]
+    assert [len(df) for df in iter_commits("any/repo", max_commits=4, batch_size=2)] == [2, 2]
+    batches = list(iter_commits("any/repo", max_commits=3, batch_size=2))
+    assert list(batches[1]["sha"]) == ["sha2"]
+
+def test_main_streams_commits_to_csv(monkeypatch, tmp_path):
+    # Test that fetch-commits writes every batch to one CSV with a single header
+    now = datetime.now()
+    commits = [DummyCommit(f"sha{i}", "Alice", "a@example.com", now, f"Commit {i}") for i in range(250)]
+    gh_instance._repo = DummyRepo(commits, [])
+    out = tmp_path / "commits.csv"
+    monkeypatch.setattr("sys.argv", ["repo_miner", "fetch-commits", "--backend", "pygithub",
+                                     "--repo", "any/repo", "--out", str(out)])
+
+    main()
+
+    df = pd.read_csv(out)
+    assert list(df.columns) == ["sha", "author", "email", "date", "message"]
+    assert len(df) == 250
+    assert df.iloc[249]["sha"] == "sha249"
+
+@pytest.mark.parametrize("name", ["keep.csv", "keep.parquet"])
+def test_main_failed_fetch_keeps_existing_output(monkeypatch, tmp_path, name):
+    # Test that a fetch failing before or during the first batch leaves an existing --out file untouched
+    out = tmp_path / name
+    out.write_text("previous contents")
+    monkeypatch.delenv("GITHUB_TOKEN")
+    for backend in ("pygithub", "rest"):
+        monkeypatch.setattr("sys.argv", ["repo_miner", "fetch-commits", "--backend", backend,
+                                         "--repo", "any/repo", "--out", str(out)])
+        with pytest.raises(ValueError, match="GITHUB_TOKEN"):
+            main()
+        assert out.read_text() == "previous contents"
+    assert sorted(p.name for p in tmp_path.iterdir()) == [name]
+
+def test_main_parquet_round_trip(monkeypatch, tmp_path, capsys):
+    # Test that a .parquet --out path is written as Parquet and summarize reads it back
+    now = datetime.now()
+    commits = [DummyCommit("sha1", "Alice", "a@example.com", now, "Commit 1")]
+    issues = [
+        DummyIssue(1, 1, "Closed issue", "alice", "closed", now - timedelta(days=4), now, 0),
+        DummyIssue(2, 2, "Open issue", "bob", "open", now, None, 0),
+    ]
+    gh_instance._repo = DummyRepo(commits, issues)
+    commits_out, issues_out = tmp_path / "commits.parquet", tmp_path / "issues.parquet"
+
+    monkeypatch.setattr("sys.argv", ["repo_miner", "fetch-commits", "--backend", "pygithub",
+                                     "--repo", "any/repo", "--out", str(commits_out)])
+    main()
+    monkeypatch.setattr("sys.argv", ["repo_miner", "fetch-issues", "--backend", "pygithub",
+                                     "--repo", "any/repo", "--out", str(issues_out)])
+    main()
+    assert list(pd.read_parquet(issues_out)["title"]) == ["Closed issue", "Open issue"]
+
+    monkeypatch.setattr("sys.argv", ["repo_miner", "summarize",
+                                     "--commits", str(commits_out), "--issues", str(issues_out)])
+    main()
+    out = capsys.readouterr().out
+    assert "  Alice: 1 commits" in out
+    assert "Issue close rate: 50.0% (1/2)" in out
+    assert "Average issue open duration: 4.0 days" in out
+
+def test_fetch_requires_token(monkeypatch):
+    # Test that every backend refuses to run without GITHUB_TOKEN
+    monkeypatch.delenv("GITHUB_TOKEN")
+    with pytest.raises(ValueError, match="GITHUB_TOKEN"):
+        fetch_commits("any/repo")
+    with pytest.raises(ValueError, match="GITHUB_TOKEN"):
+        fetch_issues("any/repo")
+    with pytest.raises(ValueError, match="GITHUB_TOKEN"):
+        asyncio.run(fetch_commits_async("any/repo", session=DummySession({})))
+    with pytest.raises(ValueError, match="GITHUB_TOKEN"):
+        asyncio.run(fetch_commits_graphql_async("any/repo", session=DummyGraphQLSession([])))
+
+def test_fetch_negative_cap_returns_no_rows(monkeypatch):
+    # Test that every backend treats a negative max as "no rows" without making requests
+    now = datetime.now()
+    gh_instance._repo = DummyRepo([DummyCommit("sha1", "Alice", "a@example.com", now, "Commit 1")],
+                                  [DummyIssue(1, 1, "Bug", "alice", "open", now, None, 0)])
+    assert list(fetch_commits("any/repo", max_commits=-1).columns) == ["sha", "author", "email", "date", "message"]
+    assert len(fetch_commits("any/repo", max_commits=-1)) == 0
+    assert len(fetch_issues("any/repo", max_issues=-1)) == 0
+
+    session = DummySession({1: [rest_commit("sha1", "Alice", "Commit 1")]})
+    assert len(asyncio.run(fetch_commits_async("any/repo", max_commits=-1, session=session))) == 0
+    assert session.requested == []
+
+    gql_session = DummyGraphQLSession([[gql_commit("sha1", "Alice", "Commit 1")]])
+    assert len(asyncio.run(fetch_commits_graphql_async("owner/name", max_commits=-1, session=gql_session))) == 0
+    assert gql_session.variables == []
+
+def test_fetch_zero_cap_means_unlimited(monkeypatch):
+    # Test that max=0 keeps its original "no limit" meaning on every backend
+    now = datetime.now()
+    gh_instance._repo = DummyRepo([DummyCommit(f"sha{i}", "Alice", "a@example.com", now, "Commit") for i in range(3)],
+                                  [DummyIssue(i, i, "Bug", "alice", "open", now, None, 0) for i in range(2)])
+    assert len(fetch_commits("any/repo", max_commits=0)) == 3
+    assert len(fetch_issues("any/repo", max_issues=0)) == 2
+
+    pages = {1: [rest_commit(f"sha{i}", "Alice", "Commit") for i in range(100)],
+             2: [rest_commit("sha100", "Alice", "Commit")]}
+    assert len(asyncio.run(fetch_commits_async("any/repo", max_commits=0, session=DummySession(pages)))) == 101
+
+    gql_pages = [[gql_commit(f"sha{i}", "Alice", "Commit") for i in range(3)]]
+    assert len(asyncio.run(fetch_commits_graphql_async("owner/name", max_commits=0,
+                                                       session=DummyGraphQLSession(gql_pages)))) == 3
+
+def test_fetch_huge_cap_preallocates_bounded(monkeypatch):
+    # Test that a cap far above the real size neither preallocates it nor loses rows past the bound
+    monkeypatch.setattr("src.repo_miner.MAX_PREALLOCATE", 3)
+    now = datetime.now()
+    gh_instance._repo = DummyRepo(
+        [DummyCommit(f"sha{i}", "Alice", "a@example.com", now, "Commit") for i in range(5)], [])
+    cap = 10 ** 9
+    assert list(fetch_commits("any/repo", max_commits=cap)["sha"]) == [f"sha{i}" for i in range(5)]
+
+    pages = {1: [rest_commit(f"sha{i}", "Alice", "Commit") for i in range(4)],
+             2: [rest_commit(f"sha{i}", "Alice", "Commit") for i in range(4, 6)]}
+    df = asyncio.run(fetch_commits_async("any/repo", max_commits=cap, session=DummySession(pages)))
+    assert list(df["sha"]) == [f"sha{i}" for i in range(6)]
+
+    gql_pages = [[gql_commit(f"sha{i}", "Alice", "Commit") for i in range(4)],
+                 [gql_commit(f"sha{i}", "Alice", "Commit") for i in range(4, 6)]]
+    df = asyncio.run(fetch_commits_graphql_async("owner/name", max_commits=cap,
+                                                 session=DummyGraphQLSession(gql_pages)))
+    assert list(df["sha"]) == [f"sha{i}" for i in range(6)]
+
+def test_main_rejects_max_below_one(monkeypatch, tmp_path):
+    # Test that the CLI refuses --max values below 1
+    monkeypatch.setattr("sys.argv", ["repo_miner", "fetch-commits", "--repo", "any/repo",
+                                     "--max", "-1", "--out", str(tmp_path / "commits.csv")])
+    with pytest.raises(SystemExit):
+        main()
+
+def test_main_streams_parquet_row_groups(monkeypatch, tmp_path):
+    # Test that Parquet output is written per batch under one schema even when batch dtypes differ
+    import pyarrow.parquet as pq
+    now = datetime.now()
+    # First page is all open (no closed_at, NaN durations), second page is all closed (int durations)
+    issues = [DummyIssue(i, i, f"Issue {i}", "alice", "open", now, None, 0) for i in range(100)]
+    issues += [DummyIssue(i, i, f"Issue {i}", "bob", "closed", now - timedelta(days=2), now, 0)
+               for i in range(100, 150)]
+    gh_instance._repo = DummyRepo([], issues)
+    out = tmp_path / "issues.parquet"
+    monkeypatch.setattr("sys.argv", ["repo_miner", "fetch-issues", "--backend", "pygithub",
+                                     "--repo", "any/repo", "--out", str(out)])
+
+    main()
+
+    parquet = pq.ParquetFile(out)
+    assert parquet.metadata.num_row_groups == 2
+    assert str(parquet.schema_arrow.field("open_duration_days").type) == "double"
+    assert str(parquet.schema_arrow.field("closed_at").type) == "string"
+    df = pd.read_parquet(out)
+    assert len(df) == 150
+    assert df.iloc[149]["open_duration_days"] == 2.0
 
 # --- Tests for fetch_issues ---
 
@@ -140,6 +409,46 @@ def test_fetch_issues_excludes_prs(monkeypatch):
     # Verify no PRs are included
     assert "Pull request" not in df["title"].values
 
+def test_iter_issues_csv_durations_format_consistently(monkeypatch, tmp_path):
+    """Test that an all-closed batch and a batch with open issues write open_duration_days the same way."""
+    now = datetime.now()
+    # The first 100-issue batch is all closed, the second one only has an open issue
+    issues = [DummyIssue(i, i, f"Closed {i}", "alice", "closed", now - timedelta(days=2), now, 0) for i in range(100)]
+    issues.append(DummyIssue(100, 100, "Open", "carol", "open", now, None, 0))
+    gh_instance._repo = DummyRepo([], issues)
+    out = tmp_path / "issues.csv"
+    monkeypatch.setattr("sys.argv", ["repo_miner", "fetch-issues", "--backend", "pygithub",
+                                     "--repo", "any/repo", "--out", str(out)])
+
+    main()
+
+    durations = [line.rsplit(",", 1)[1] for line in out.read_text().splitlines()[1:]]
+    assert durations == ["2.0"] * 100 + [""]
+
+def test_fetch_issues_pygithub_does_not_lazy_load():
+    """Test that telling issues from PRs on real PyGitHub objects sends no completion request."""
+    from github.Issue import Issue
+
+    class NoRequests:
+        is_not_lazy = False
+
+        def requestJsonAndCheck(self, *args, **kwargs):
+            raise AssertionError(f"unexpected request {args}")
+
+    def list_item(number, kind):
+        return Issue(NoRequests(), {}, {
+            "url": f"https://api.github.com/repos/owner/repo/issues/{number}",
+            "html_url": f"https://github.com/owner/repo/{kind}/{number}",
+            "id": number, "number": number, "title": f"Item {number}", "user": {"login": "alice"},
+            "state": "open", "created_at": "2025-10-01T00:00:00Z", "closed_at": None, "comments": 0,
+        }, completed=False)
+
+    gh_instance._repo = DummyRepo([], [list_item(1, "issues"), list_item(2, "pull")])
+
+    df = fetch_issues("any/repo")
+
+    assert list(df["number"]) == [1]
+
 def test_fetch_issues_date_normalization(monkeypatch):
     """Test that dates are properly normalized to ISO-8601 format."""
     now = datetime.now()
@@ -184,3 +493,206 @@ def test_fetch_issues_open_duration_calculation(monkeypatch):
     # Open issues should have NaN (pandas converts None to NaN in DataFrames)
     import math
     assert math.isnan(open_issue["open_duration_days"])
+
+# --- Tests for the async REST backend ---
+
+def test_fetch_commits_async_pages_and_limit():
+    """Test that commit pages are fetched in order and only as many as max_commits needs."""
+    pages = {
+        1: [rest_commit(f"sha{i}", "Alice", f"Commit {i}\nBody") for i in range(100)],
+        2: [rest_commit(f"sha{i}", "Bob", f"Commit {i}") for i in range(100, 200)],
+        3: [rest_commit(f"sha{i}", "Eve", f"Commit {i}") for i in range(200, 300)],
+    }
+    session = DummySession(pages)
+
+    df = asyncio.run(fetch_commits_async("any/repo", max_commits=150, session=session))
+
+    assert list(df.columns) == ["sha", "author", "email", "date", "message"]
+    assert len(df) == 150
+    assert sorted(session.requested) == [1, 2]
+    assert df.iloc[0]["message"] == "Commit 0"
+    assert df.iloc[149]["sha"] == "sha149"
+    assert df.iloc[0]["date"] == "2025-10-17T00:06:01+00:00"
+
+def test_fetch_commits_async_limit_above_total():
+    """Test that a max_commits larger than the repo leaves no unfilled preallocated rows."""
+    pages = {1: [rest_commit(f"sha{i}", "Alice", "Commit") for i in range(100)],
+             2: [rest_commit(f"sha{i}", "Bob", "Commit") for i in range(100, 130)]}
+
+    df = asyncio.run(fetch_commits_async("any/repo", max_commits=500, session=DummySession(pages)))
+
+    assert len(df) == 130
+    assert df["sha"].notna().all()
+
+def test_fetch_issues_async_excludes_prs():
+    """Test that the REST backend skips pull requests and computes open durations."""
+    pages = {
+        1: [rest_issue(1, "closed", "2025-10-01T00:00:00Z", "2025-10-04T12:00:00Z"),
+            rest_issue(2, "open", "2025-10-02T00:00:00Z", is_pr=True)],
+        2: [rest_issue(3, "open", "2025-10-03T00:00:00Z")],
+    }
+    df = asyncio.run(fetch_issues_async("any/repo", session=DummySession(pages)))
+
+    assert list(df["number"]) == [1, 3]
+    assert df.iloc[0]["created_at"] == "2025-10-01T00:00:00+00:00"
+    assert df.iloc[0]["open_duration_days"] == 3
+    import math
+    assert math.isnan(df.iloc[1]["open_duration_days"])
+
+def test_iter_commits_async_yields_pages():
+    """Test that the REST backend hands back one DataFrame per page, in page order."""
+    pages = {p: [rest_commit(f"sha{p}-{i}", "Alice", "Commit") for i in range(100)] for p in (1, 2, 3)}
+
+    async def collect():
+        return [df async for df in iter_commits_async("any/repo", max_commits=250, session=DummySession(pages))]
+
+    frames = asyncio.run(collect())
+    assert [len(df) for df in frames] == [100, 100, 50]
+    assert [df.iloc[0]["sha"] for df in frames] == ["sha1-0", "sha2-0", "sha3-0"]
+
+def test_iter_commits_async_bounds_pages_ahead_of_slow_page():
+    """Test that a slow page holds back at most MAX_CONCURRENCY pages instead of buffering the rest."""
+    class SlowHeadSession(DummySession):
+        def request(self, method, url, params=None, headers=None):
+            self.requested.append(params["page"])
+            delay = 0.2 if params["page"] == 2 else 0
+            return DummyResponse(self._pages[params["page"]], last_page=len(self._pages), delay=delay)
+
+    session = SlowHeadSession({p: [rest_commit(f"sha{p}", "Alice", "Commit")] for p in range(1, 301)})
+
+    async def collect():
+        outstanding = {}
+        async for df in iter_commits_async("any/repo", session=session):
+            page = int(df.iloc[0]["sha"][3:])
+            # Pages requested but not yet handed to us
+            outstanding[page] = len(session.requested) - page
+        return outstanding
+
+    outstanding = asyncio.run(collect())
+    assert len(outstanding) == 300
+    assert outstanding[2] <= MAX_CONCURRENCY - 1
+    assert max(outstanding.values()) <= MAX_CONCURRENCY
+
+def test_main_defaults_to_rest_backend(monkeypatch, tmp_path):
+    """Test that fetch-issues goes through the REST backend by default and streams every page."""
+    pages = {
+        1: [rest_issue(1, "open", "2025-10-01T00:00:00Z"), rest_issue(2, "open", "2025-10-01T00:00:00Z", is_pr=True)],
+        2: [rest_issue(3, "closed", "2025-10-01T00:00:00Z", "2025-10-02T00:00:00Z")],
+    }
+    session = DummySession(pages)
+    monkeypatch.setattr("src.repo_miner.aiohttp.ClientSession", lambda: session)
+    out = tmp_path / "issues.csv"
+    monkeypatch.setattr("sys.argv", ["repo_miner", "fetch-issues", "--repo", "any/repo", "--out", str(out)])
+
+    main()
+
+    df = pd.read_csv(out)
+    assert list(df["number"]) == [1, 3]
+    assert sorted(session.requested) == [1, 2]
+
+# --- Tests for rate limiting and retries ---
+
+def test_gh_get_retries_after_secondary_rate_limit():
+    """Test that a 403 with Retry-After is retried and then succeeds."""
+    session = DummySession({1: [rest_commit("sha1", "Alice", "Commit 1")]},
+                           failures={1: [(403, {"Retry-After": "0"})]})
+    headers = {"Authorization": "token fake-token"}
+
+    data, _ = asyncio.run(gh_get(session, "https://api.github.com/x", {"page": 1}, headers))
+
+    assert session.requested == [1, 1]
+    assert data[0]["sha"] == "sha1"
+
+def test_gh_get_does_not_retry_plain_forbidden():
+    """Test that a 403 without rate-limit headers fails immediately."""
+    session = DummySession({1: []}, failures={1: [(403, {})]})
+    headers = {"Authorization": "token fake-token"}
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(gh_get(session, "https://api.github.com/x", {"page": 1}, headers))
+    assert session.requested == [1]
+
+def test_rate_limiter_tracks_lowest_remaining():
+    """Test that out-of-order responses within one window keep the lowest remaining count."""
+    limiter = RateLimiter(low_water=1)
+    limiter.update({"X-RateLimit-Remaining": "50", "X-RateLimit-Reset": "100"})
+    limiter.update({"X-RateLimit-Remaining": "60", "X-RateLimit-Reset": "100"})
+    assert limiter.remaining == 50
+    # A new reset time means a fresh window
+    limiter.update({"X-RateLimit-Remaining": "5000", "X-RateLimit-Reset": "200"})
+    assert limiter.remaining == 5000
+    asyncio.run(limiter.acquire())
+    assert limiter.remaining == 4999
+
+# --- Tests for the GraphQL backend ---
+
+def test_fetch_commits_graphql_follows_cursor_and_limit():
+    """Test that GraphQL history pages are walked by cursor until max_commits is reached."""
+    pages = [
+        [gql_commit(f"sha{i}", "Alice", f"Commit {i}\nBody") for i in range(100)],
+        [gql_commit(f"sha{i}", "Bob", f"Commit {i}") for i in range(100, 200)],
+        [gql_commit(f"sha{i}", "Eve", f"Commit {i}") for i in range(200, 300)],
+    ]
+    session = DummyGraphQLSession(pages)
+
+    df = asyncio.run(fetch_commits_graphql_async("owner/name", max_commits=120, session=session))
+
+    assert list(df.columns) == ["sha", "author", "email", "date", "message"]
+    assert len(df) == 120
+    assert [v["cursor"] for v in session.variables] == [None, "c1"]
+    assert [v["first"] for v in session.variables] == [100, 20]
+    assert session.variables[0]["owner"] == "owner" and session.variables[0]["name"] == "name"
+    assert df.iloc[0]["message"] == "Commit 0"
+    # Author dates are normalized to UTC like the REST backend
+    assert df.iloc[0]["date"] == "2025-10-17T00:06:01+00:00"
+
+# --- Tests for merge_and_summarize ---
+
+def test_merge_and_summarize_output(capsys):
+    """Test the printed summary and that nothing is returned."""
+    commits_df = pd.DataFrame({"author": ["Alice", "Bob", "Alice", "Carol", "Alice", "Bob"]})
+    issues_df = pd.DataFrame({
+        "state": ["closed", "open", "closed", "closed"],
+        "open_duration_days": [2.0, None, 5.0, None],
+    })
+
+    assert merge_and_summarize(commits_df, issues_df) is None
+
+    out = capsys.readouterr().out
+    assert "  Alice: 3 commits\n  Bob: 2 commits\n  Carol: 1 commits" in out
+    assert "Issue close rate: 75.0% (3/4)" in out
+    assert "Average issue open duration: 3.5 days" in out
+
+def test_merge_and_summarize_no_closed_issues(capsys):
+    """Test the N/A message when no closed issue has a duration."""
+    merge_and_summarize(pd.DataFrame({"author": []}),
+                        pd.DataFrame({"state": ["open"], "open_duration_days": [None]}))
+    assert "Average issue open duration: N/A" in capsys.readouterr().out
+
+def test_main_summarize_sample_data(monkeypatch, capsys):
+    """Test the summarize command end to end on the bundled vscode sample CSVs."""
+    data = Path(__file__).resolve().parent.parent / "data"
+    monkeypatch.setattr("sys.argv", ["repo_miner", "summarize",
+                                     "--commits", str(data / "vscode_commits.csv"),
+                                     "--issues", str(data / "vscode_issues.csv")])
+    main()
+    out = capsys.readouterr().out
+    assert "  Martin Aeschlimann: 3 commits" in out
+    assert "Issue close rate: 35.0% (7/20)" in out
+
+def test_summarize_files_merges_shards(tmp_path, capsys):
+    """Test that per-shard partial summaries add up to the same figures as one file."""
+    data = Path(__file__).resolve().parent.parent / "data"
+    commits = pd.read_csv(data / "vscode_commits.csv")
+    issues = pd.read_csv(data / "vscode_issues.csv")
+    commit_paths, issue_paths = [], []
+    for i, (c, s) in enumerate(zip((commits[:10], commits[10:]), (issues[:7], issues[7:]))):
+        commit_paths.append(str(tmp_path / f"commits-{i}.csv"))
+        issue_paths.append(str(tmp_path / f"issues-{i}.csv"))
+        c.to_csv(commit_paths[-1], index=False)
+        s.to_csv(issue_paths[-1], index=False)
+
+    summarize_files(commit_paths, issue_paths)
+    sharded = capsys.readouterr().out
+    merge_and_summarize(commits, issues)
+    assert sharded == capsys.readouterr().out